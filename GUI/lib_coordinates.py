@@ -6,18 +6,39 @@
 # Size of source mod 2**32: 13303 bytes
 import numpy as np
 from tinydb import TinyDB, Query
+from operator import itemgetter
 import sys
 
+try:
+    import simdjson
+    _json_parser = simdjson.Parser()
+except ImportError:  # optional speedup, TinyDB handles every read without it
+    _json_parser = None
+
 class coordinates:
 
     def __init__(self, file_directory='./', name='coordinates.json', read_file=False):
         self.path = file_directory
-        self.device_db = TinyDB(name)
+        self.db_file = name
+        self._device_db = None
         self.device = Query()
         if read_file == True:
             self.device_db.truncate()
             self.read_file()
 
+    @property
+    def device_db(self):
+        """
+        TinyDB handle, opened on first use
+
+        Constructing a coordinates object no longer parses the database
+        file up front, callers that only hit the simdjson fast path never
+        pay for it at all
+        """
+        if self._device_db is None:
+            self._device_db = TinyDB(self.db_file)
+        return self._device_db
+
     def read_file(self):
         """
         Reads the file and extracts data from file
@@ -116,13 +137,61 @@ class coordinates:
             device_list_polarization = device_list_wavelength
         return list(set(device_list_wavelength) & set(device_list_polarization))
 
+    def _device_columns(self, parameters):
+        """
+        Pull parameters straight out of the database file with simdjson
+
+        The lazy parse only touches the requested fields of each device
+        instead of materializing every record, returns None when simdjson
+        is missing or the file cannot be read so callers fall back to TinyDB
+        """
+        if _json_parser is None:
+            return None
+        try:
+            with open(self.db_file, "rb") as f:
+                table = _json_parser.parse(f.read())["_default"]
+        except Exception:
+            return None
+        device_lists = [[] for _ in parameters]
+        for device in table.values():
+            for values, parameter in zip(device_lists, parameters):
+                value = device[parameter]
+                if not isinstance(value, (int, float, str)):
+                    value = list(value)
+                values.append(value)
+
+        return device_lists
+
+    def _device_values(self, parameter):
+        device_columns = self._device_columns([parameter])
+        if device_columns is None:
+            return None
+        return device_columns[0]
+
     def listdeviceparam(self, parameter):
-        device_list = []
-        database_entries = self.device_db.all()
-        for device in database_entries:
-            device_list.append(device[str(parameter)])
+        device_list = self._device_values(str(parameter))
+        if device_list is not None:
+            return device_list
+        return list(map(itemgetter(str(parameter)), self.device_db.all()))
 
-        return device_list
+    def listdeviceparams(self, parameters):
+        """
+        Extract several parameters in one pass over the database
+
+        Returns one list per requested parameter, in order, same result as
+        calling listdeviceparam for each but without re-walking the devices
+        """
+        parameters = [str(parameter) for parameter in parameters]
+        device_lists = self._device_columns(parameters)
+        if device_lists is not None:
+            return device_lists
+        database_entries = self.device_db.all()
+        if not database_entries:
+            return [[] for _ in parameters]
+        if len(parameters) == 1:
+            return [list(map(itemgetter(parameters[0]), database_entries))]
+        rows = map(itemgetter(*parameters), database_entries)
+        return [list(column) for column in zip(*rows)]
 
     def finddevicesbywavelength(self, string):
         find = Query()
@@ -1,7 +1,9 @@
 from remi.gui import *
 import os
+import html
 import time
 from multiprocessing import Process
+from functools import lru_cache
 from time import sleep, monotonic
 from motors.config.stage_position import *
 from motors.config.stage_config import *
@@ -100,6 +102,17 @@ def apply_common_style(widget, left, top, width, height, position="absolute", pe
         widget.css_width = f"{width}px"
         widget.css_height = f"{height}px"
 
+# Scrollable-container styling is identical for every overflow container
+_OVERFLOW_STYLE = {
+    "overflow": "auto",
+    "overflow-y": "scroll",
+    "overflow-x": "hidden",
+    "max-height": "320px",
+    "scrollbar-width": "thin",
+    "border-radius": "4px",
+    "padding-right": "4px"
+}
+
 class StyledContainer(Container):
     def __init__(self, variable_name, left, top, width=650, height=650, border=False, bg_color=False, color = "#707070",
                  position="absolute", percent=False, overflow=False, container=None, line="1.5px solid #888"):
@@ -112,18 +125,24 @@ class StyledContainer(Container):
         if bg_color:
             self.style["background-color"] = color
         if overflow:
-            self.style.update({
-                "overflow": "auto",
-                "overflow-y": "scroll",
-                "overflow-x": "hidden",
-                "max-height": "320px",
-                "scrollbar-width": "thin",
-                "border-radius": "4px",
-                "padding-right": "4px"
-            })
+            self.style.update(_OVERFLOW_STYLE)
         if container:
             container.append(self, self.variable_name)
 
+# Button styling varies only in its resting color and font size across the
+# ~40 call sites; share one dict per combination (update() from it only).
+@lru_cache(maxsize=32)
+def _button_style(normal_color, font_size):
+    return {
+        "background-color": normal_color,
+        "color": "white",
+        "border": "none",
+        "border-radius": "4px",
+        "box-shadow": "0 2px 5px rgba(0,0,0,0.2)",
+        "cursor": "pointer",
+        "font-size": f"{font_size}%"
+    }
+
 class StyledButton(Button):
     def __init__(self, text, variable_name, left, top,
                  normal_color="#007BFF", press_color="#0056B3",
@@ -135,15 +154,7 @@ class StyledButton(Button):
         self.variable_name  = variable_name
         self.normal_color   = normal_color
         self.press_color    = press_color
-        self.style.update({
-            "background-color": normal_color,
-            "color": "white",
-            "border": "none",
-            "border-radius": "4px",
-            "box-shadow": "0 2px 5px rgba(0,0,0,0.2)",
-            "cursor": "pointer",
-            "font-size": f"{font_size}%"
-        })
+        self.style.update(_button_style(normal_color, font_size))
 
         # --- 视觉反馈 ---
         self.onmousedown.do(lambda w,*a: w.style.update(
@@ -170,33 +181,55 @@ class StyledButton(Button):
         self._user_callback = lambda *_: cb()
 
 
+# Label styling depends only on these kwargs and the call sites reuse a
+# handful of combinations, so compute each style dict once instead of per
+# instance. The returned dict is shared — update() from it, never mutate it.
+@lru_cache(maxsize=64)
+def _label_style(font_size, color, align, flex, justify_content, bold, on_line, border, static=False):
+    style = {"font-size": f"{font_size}%", "color": color}
+    if static:
+        # Plain block layout for cells whose text never re-flows; avoids
+        # giving the browser a flex formatting context per table cell.
+        style["display"] = "block"
+        style["text-align"] = align
+    elif flex:
+        style.update({
+            "display": "flex",
+            "justify-content": justify_content,
+            "align-items": "center"
+        })
+    else:
+        style["text-align"] = align
+    if bold:
+        style["font-weight"] = "bold"
+    if on_line:
+        style["background-color"] = "white"
+    if border:
+        style["border"] = "1.5px solid #888"
+        style["border-radius"] = "4px"
+    return style
+
 class StyledLabel(Label):
     def __init__(self, text, variable_name, left, top,
                  width=150, height=20, font_size=100, color="#444", align="left", position="absolute", percent=False,
-                 bold=False, flex=False, justify_content="center", on_line=False, border=False, container=None):
+                 bold=False, flex=False, justify_content="center", on_line=False, border=False,
+                 static=False, container=None):
         super().__init__(text)
         apply_common_style(self, left, top, width, height, position, percent)
-        self.css_font_size = f"{font_size}%"
         self.variable_name = variable_name
-        if flex:
-            self.style.update({
-                "display": "flex",
-                "justify-content": justify_content,
-                "align-items": "center"
-            })
-        else:
-            self.css_text_align = align
-        self.style["color"] = color
-        if bold:
-            self.style["font-weight"] = "bold"
-        if on_line:
-            self.style["background-color"] = "white"
-        if border:
-            self.style["border"] = "1.5px solid #888"
-            self.style["border-radius"] = "4px"
+        self.style.update(_label_style(font_size, color, align, flex,
+                                       justify_content, bold, on_line, border, static))
         if container:
             container.append(self, self.variable_name)
 
+    def set_text(self, text):
+        # Writing an unchanged value still marks the widget dirty and pushes
+        # a client update; the polling handlers call set_text every pass, so
+        # skip the no-op writes.
+        if text == self.get_text():
+            return
+        super().set_text(text)
+
 class StyledDropDown(DropDown):
     def __init__(self, text, variable_name, left, top,
                  width=220, height=30, font_size=100, bg_color="#f9f9f9",
@@ -216,9 +249,19 @@ class StyledDropDown(DropDown):
             container.append(self, self.variable_name)
 
 class Terminal(TextInput):
+    # Minimum seconds between refresh checks. idle() ticks every ~100 ms in
+    # every app; polling the log mtime at 4 Hz is plenty for a log viewer and
+    # coalesces bursts of writes into one DOM update.
+    REFRESH_INTERVAL = 0.25
+    # Lines shown per terminal. Every open tab runs its own Terminal against
+    # the same log.txt; reading just the tail keeps each refresh O(tail)
+    # regardless of how large the log grows between launcher trims.
+    TAIL_LINES = 200
+
     def __init__(self, container, variable_name, left, top, width=220, height=30, percent=False):
         super().__init__(singleline=False)
         self.timestamp = -1
+        self._next_refresh = 0.0
         self.attr_src = ""
         apply_common_style(self, left, top, width, height, percent=percent)
         self.variable_name = variable_name
@@ -238,6 +281,10 @@ class Terminal(TextInput):
         self.container = container
 
     def terminal_refresh(self):
+        now = monotonic()
+        if now < self._next_refresh:
+            return
+        self._next_refresh = now + self.REFRESH_INTERVAL
         path = os.path.join(os.getcwd(), "log.txt")
         try:
             filetime = os.path.getmtime(path)
@@ -245,14 +292,30 @@ class Terminal(TextInput):
             filetime = -1
         if filetime > self.timestamp:
             try:
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    log_text = f.read()
+                lines = self._read_tail(path, self.TAIL_LINES)
             except Exception as e:
-                log_text = f"[Error reading log file] {e}"
-            reversed_log = "\n".join(reversed(log_text.split("\n")))
+                lines = [f"[Error reading log file] {e}"]
+            reversed_log = "\n".join(reversed(lines))
             self.container.children["terminal_text"].set_text(reversed_log)
             self.timestamp = filetime
 
+    @staticmethod
+    def _read_tail(path, n):
+        # Read backwards in blocks until n newlines are collected, so the
+        # refresh cost does not scale with the file size.
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            block = 64 * 1024
+            buf = b""
+            while pos > 0 and buf.count(b"\n") <= n:
+                size = min(block, pos)
+                pos -= size
+                f.seek(pos)
+                buf = f.read(size) + buf
+        text = buf.decode("utf-8", errors="replace")
+        return text.split("\n")[-n:]
+
 class StyledFileUploader(FileUploader):
     def __init__(self, variable_name, left, top, width=300, height=30, position="absolute", percent=False, container=None, savepath="./res/"):
         super().__init__()
@@ -278,8 +341,10 @@ class StyledTable(Table):
             "color": "#2e2e2e",
             "line-height": "1.4"
         })
+        # Rows and cells get stable keys (row_N / cell_N) so call sites can
+        # index children directly instead of listing the OrderedDict values.
         trh = TableRow()
-        for h, w in zip(headers, widths):
+        for c, (h, w) in enumerate(zip(headers, widths)):
             trh.append(TableItem(h, style={
                 "width": f"{w}px",
                 "height": f"{height}px",
@@ -289,12 +354,12 @@ class StyledTable(Table):
                 "color": "#1a1a1a",
                 "border-bottom": "2px solid #c8c8c8",
                 "padding": "1px 2px"
-            }))
-        self.append(trh)
+            }), f"cell_{c}")
+        self.append(trh, "row_0")
         for r in range(row - 1):
             tr = TableRow()
             bg = "#9aa3af" if r % 2 == 0 else "#7b8494"
-            for w in widths:
+            for c, w in enumerate(widths):
                 tr.append(TableItem("", style={
                     "width": f"{w}px",
                     "height": f"{height}px",
@@ -302,11 +367,68 @@ class StyledTable(Table):
                     "background-color": bg,
                     "border-bottom": "1px solid #ebebeb",
                     "padding": "1px 2px"
-                }))
-            self.append(tr)
+                }), f"cell_{c}")
+            self.append(tr, f"row_{r + 1}")
+        if container:
+            container.append(self, self.variable_name)
+
+class FastTable(Widget):
+    """Read-only table rendered as one raw-HTML child.
+
+    StyledTable tracks one remi widget per cell, which is fine for the small
+    interactive tables but heavy for larger text-only listings. FastTable
+    keeps the cell text in plain lists and renders the whole <table> as a
+    single HTML string, so the server-side tree holds one node and a full
+    update is one DOM replacement. Cells cannot hold child widgets; keep
+    using StyledTable when a cell needs a dropdown or checkbox.
+    """
+
+    def __init__(self, variable_name, left, top, table_width, headers, widths,
+                 height=30, position="absolute", container=None):
+        super().__init__()
+        apply_common_style(self, left, top, table_width, height, position)
+        self.variable_name = variable_name
+        self.headers = list(headers)
+        self.widths = list(widths)
+        self.row_height = height
+        self.rows = []
+        self._render()
         if container:
             container.append(self, self.variable_name)
 
+    def set_rows(self, rows):
+        self.rows = [[str(v) for v in row] for row in rows]
+        self._render()
+
+    def update_cell(self, r, c, value):
+        self.rows[r][c] = str(value)
+        self._render()
+
+    def _render(self):
+        head = "".join(
+            f'<th style="width:{w}px;height:{self.row_height}px;font-weight:bold;'
+            f'text-align:center;background-color:#6f7a8a;color:#1a1a1a;'
+            f'border-bottom:2px solid #c8c8c8;padding:1px 2px">{html.escape(h)}</th>'
+            for h, w in zip(self.headers, self.widths)
+        )
+        body = []
+        for r, row in enumerate(self.rows):
+            bg = "#9aa3af" if r % 2 == 0 else "#7b8494"
+            cells = "".join(
+                f'<td id="{self.variable_name}_r{r}_c{c}" style="width:{w}px;'
+                f'height:{self.row_height}px;text-align:right;background-color:{bg};'
+                f'border-bottom:1px solid #ebebeb;padding:1px 2px;overflow:hidden;'
+                f'text-overflow:ellipsis;white-space:nowrap">{html.escape(v)}</td>'
+                for c, (v, w) in enumerate(zip(row, self.widths))
+            )
+            body.append(f"<tr>{cells}</tr>")
+        table = (
+            '<table style="table-layout:fixed;width:100%;border-collapse:collapse;'
+            'font-family:Arial, sans-serif;font-size:13.5px;color:#2e2e2e;'
+            f'line-height:1.4"><tr>{head}</tr>{"".join(body)}</table>'
+        )
+        self.add_child("table_html", table)
+
 class StyledCheckBox(CheckBox):
     def __init__(self, variable_name, left, top, width=30, height=30, position="absolute", percent=False, container=None):
         super().__init__()
@@ -494,6 +616,36 @@ class File():
 
         self._safe_write(data, filepath)
 
+class ActiveTabGate():
+    """Lets a tabbed app skip background refresh work while hidden.
+
+    The mainframe records the selected tab name under "ActiveTab" in
+    shared_memory.json; children stat the file each idle tick and re-read
+    it only when the mtime moved. Reports active when the key has never
+    been written, so the apps still refresh when run standalone.
+    """
+
+    def __init__(self, tab_name):
+        self.tab_name = tab_name
+        self._mtime = None
+        self._active = True
+        self._path = os.path.join("database", "shared_memory.json")
+
+    def is_active(self):
+        try:
+            mtime = os.path.getmtime(self._path)
+        except OSError:
+            return True
+        if mtime != self._mtime:
+            self._mtime = mtime
+            try:
+                with open(self._path, "r", encoding="utf-8") as f:
+                    active = json.load(f).get("ActiveTab")
+            except Exception:
+                active = None
+            self._active = active is None or active == self.tab_name
+        return self._active
+
 class plot():
     def __init__(self, x=None, y=None, filename=None, fileTime=None, user=None, name=None, project=None, data=None,
                  file_format=None, file_path=""):
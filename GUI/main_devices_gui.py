@@ -2,10 +2,12 @@ from remi.gui import *
 from lib_gui import *
 from remi import start, App
 import lib_coordinates,threading, math, json
+from functools import lru_cache
 from tinydb import TinyDB, Query
 
 command_path = os.path.join("database", "command.json")
 
+@lru_cache(maxsize=4096)
 def fmt(val):
     try:
         return f"{float(val):.2f}"
@@ -14,6 +16,20 @@ def fmt(val):
 
 
 class devices(App):
+    # Shared by every cell built in build_table_rows; the per-column width
+    # is merged in when the cell is created.
+    _CELL_STYLE = {
+        "height": "30px",
+        "text-align": "center",
+        "border-bottom": "1px solid #ebebeb",
+        "padding": "1px 2px",
+        "overflow": "hidden",
+        "text-overflow": "ellipsis",
+        "white-space": "nowrap",
+    }
+    # Indexed by row parity, (start_i + row_idx) & 1.
+    _ROW_BG = ({"background-color": "#9aa3af"}, {"background-color": "#7b8494"})
+
     def __init__(self, *args, **kwargs):
         self.gds = None
         self.number = []
@@ -27,14 +43,36 @@ class devices(App):
         self.filtered_idx = []
         self.page_size = 50
         self.page_index = 0
+        # Checkbox pool: one widget per visible row position, remapped to the
+        # underlying device index on every render. Keeps the widget count
+        # bounded by the page size instead of the dataset size.
+        self._row_checkboxes = []
+        self._row_global = []
+        self._cb_row = {}
+        # Data rows in table order, maintained as rows are appended so the
+        # render never has to copy table.children to skip the header.
+        self._data_rows = []
 
         self._user_mtime = None
         self._first_command_check = True
+        self.terminal = None
+        self._tab_gate = ActiveTabGate("devices")
         if "editing_mode" not in kwargs:
             super(devices, self).__init__(*args, **{"static_file_path": {"my_res": "./res/"}})
 
     def idle(self):
-        self.terminal.terminal_refresh()
+        # Terminal upkeep only runs while this tab is visible; the command
+        # polling below must keep running regardless so remote commands are
+        # still executed when another tab is active.
+        if self._tab_gate.is_active():
+            # Terminal is built on the first idle tick instead of in
+            # construct_ui, so first paint is not blocked by the log viewer.
+            if self.terminal is None:
+                self.terminal = Terminal(
+                    container=self.terminal_container, variable_name="terminal_text",
+                    left=10, top=15, width=610, height=100
+                )
+            self.terminal.terminal_refresh()
 
         try:
             mtime = os.path.getmtime(command_path)
@@ -52,9 +90,29 @@ class devices(App):
     def main(self):
         return devices.construct_ui(self)
 
+    @staticmethod
+    def _set_cell_text(cell, text, title=None):
+        """Write the cell text and tooltip, skipping unchanged values.
+
+        Every set_text goes out to the browser, so repeated renders of the
+        same page should not resend identical cell contents.
+        """
+        if getattr(cell, "_last_text", None) != text:
+            cell.set_text(text)
+            cell.attributes["title"] = text if title is None else title
+            cell._last_text = text
+
     def build_table_rows(self):
+        # Callers run in background threads (load/filter/pagination clicks).
+        # Holding remi's update lock for the whole rebuild keeps the mutation
+        # atomic and lets the server push one coalesced client update instead
+        # of one per cell write.
+        with self.update_lock:
+            self._build_table_rows_locked()
+
+    def _build_table_rows_locked(self):
         table = self.table
-        data_rows = list(table.children.values())[1:]
+        data_rows = self._data_rows
 
         start_i = self.page_index * self.page_size
         end_i = min(len(self.filtered_idx), start_i + self.page_size)
@@ -65,56 +123,45 @@ class devices(App):
         if needed > cur:
             for _ in range(needed - cur):
                 tr = TableRow()
-                for w in self.col_widths:
-                    tr.append(TableItem("", style={
-                        "width": f"{w}px",
-                        "height": "30px",
-                        "text-align": "center",
-                        "border-bottom": "1px solid #ebebeb",
-                        "padding": "1px 2px",
-                        "overflow": "hidden",
-                        "text-overflow": "ellipsis",
-                        "white-space": "nowrap"
-                    }))
-                table.append(tr)
+                for c, wpx in enumerate(self._col_width_px):
+                    tr.append(TableItem("", style={**self._CELL_STYLE, "width": wpx}),
+                              f"cell_{c}")
+                table.append(tr, f"row_{len(data_rows) + 1}")
                 data_rows.append(tr)
 
+        self._row_global = list(page_idx_slice)
+
         for row_idx, row in enumerate(data_rows):
             if row_idx < needed:
                 global_idx = page_idx_slice[row_idx]
+                row.style["display"] = "table-row"
                 cells = list(row.children.values())
-                bg = "#9aa3af" if (start_i + row_idx) % 2 == 0 else "#7b8494"
-                for c in cells:
-                    c.style.update({"display": "table-cell", "background-color": bg})
+                bg_style = self._ROW_BG[(start_i + row_idx) & 1]
+                if getattr(row, "_last_bg", None) is not bg_style:
+                    for c in cells:
+                        c.style.update(bg_style)
+                    row._last_bg = bg_style
 
-                cells[0].set_text(self.devicename[global_idx])
-                cells[0].attributes["title"] = self.devicename[global_idx]
-                cb_name = f"test_{global_idx}"
+                self._set_cell_text(cells[0], self.devicename[global_idx])
 
-                if not hasattr(self, cb_name):
-                    cb = StyledCheckBox(container=None, variable_name=cb_name,
+                if row_idx >= len(self._row_checkboxes):
+                    cb = StyledCheckBox(container=None, variable_name=f"test_row_{row_idx}",
                                         left=0, top=0, width=10, height=10, position="inherit")
-                    cb.onchange.do(lambda emitter, value, idx=global_idx:
-                                   self.checkbox_state.__setitem__(idx, value))
-                    setattr(self, cb_name, cb)
+                    self._cb_row[cb] = row_idx
+                    cb.onchange.do(self._on_test_toggle)
+                    self._row_checkboxes.append(cb)
+                    cells[1].append(cb)
 
-                cb = getattr(self, cb_name)
+                cb = self._row_checkboxes[row_idx]
                 cb.set_value(self.checkbox_state[global_idx])
-                cells[1].empty()
-                cells[1].append(cb)
-                cells[2].set_text(self.polarization[global_idx])
-                cells[2].attributes["title"] = self.polarization[global_idx]
-                cells[3].set_text(fmt(self.wavelength[global_idx]))
-                cells[3].attributes["title"] = self.wavelength[global_idx]
-                cells[4].set_text(self.type[global_idx])
-                cells[4].attributes["title"] = self.type[global_idx]
-                cells[5].set_text(fmt(self.coordinate[global_idx][0]))
-                cells[5].attributes["title"] = fmt(self.coordinate[global_idx][0])
-                cells[6].set_text(fmt(self.coordinate[global_idx][1]))
-                cells[6].attributes["title"] = fmt(self.coordinate[global_idx][1])
+                self._set_cell_text(cells[2], self.polarization[global_idx])
+                self._set_cell_text(cells[3], fmt(self.wavelength[global_idx]),
+                                    self.wavelength[global_idx])
+                self._set_cell_text(cells[4], self.type[global_idx])
+                self._set_cell_text(cells[5], fmt(self.coordinate[global_idx][0]))
+                self._set_cell_text(cells[6], fmt(self.coordinate[global_idx][1]))
             else:
-                for c in row.children.values():
-                    c.style["display"] = "none"
+                row.style["display"] = "none"
 
         self.page_input.set_text(str(self.page_index + 1))
         self.prev_btn.set_enabled(self.page_index != 0)
@@ -139,6 +186,7 @@ class devices(App):
 
         headers = ["Device ID", "Test", "Mode", "Wvl", "Type", "x", "y"]
         self.col_widths = [180, 30, 30, 50, 50, 60, 60]
+        self._col_width_px = tuple(f"{w}px" for w in self.col_widths)
 
         self.table = StyledTable(
             container=coordinate_container, variable_name="device_table",
@@ -239,14 +287,12 @@ class devices(App):
             container=pg, text="Load", variable_name="load_page", left=330, top=5, width=60, height=25
         )
 
-        terminal_container = StyledContainer(
+        self.terminal_container = StyledContainer(
             container=devices_container, variable_name="terminal_container",
             left=0, top=500, height=150, width=650, bg_color=True
         )
 
-        self.terminal = Terminal(
-            container=terminal_container, variable_name="terminal_text", left=10, top=15, width=610, height=100
-        )
+        self.terminal = None  # created lazily in idle()
 
         self.prev_btn.do_onclick(lambda *_: self.run_in_thread(self.goto_prev_page))
         self.next_btn.do_onclick(lambda *_: self.run_in_thread(self.goto_next_page))
@@ -301,12 +347,19 @@ class devices(App):
         self.page_index = 0
         self.build_table_rows()
 
+    def _on_test_toggle(self, emitter, value):
+        # One handler delegated to all pooled checkboxes; the emitter's row
+        # position resolves to whichever device currently occupies that row.
+        self.checkbox_state[self._row_global[self._cb_row[emitter]]] = value
+
+    def _sync_visible_checkboxes(self):
+        for cb, global_idx in zip(self._row_checkboxes, self._row_global):
+            cb.set_value(self.checkbox_state[global_idx])
+
     def __set_all_checkboxes(self, value: bool):
         for idx in self.filtered_idx:
             self.checkbox_state[idx] = value
-            cb = getattr(self, f"test_{idx}", None)
-            if cb is not None:
-                cb.set_value(value)
+        self._sync_visible_checkboxes()
 
     def onclick_clear(self):
         self.__set_all_checkboxes(False)
@@ -330,13 +383,10 @@ class devices(App):
 
     def read_file(self):
         self.gds = lib_coordinates.coordinates(read_file=False, name="./database/coordinates.json")
-        self.number = self.gds.listdeviceparam("number")
-        self.coordinate = self.gds.listdeviceparam("coordinate")
-        self.polarization = self.gds.listdeviceparam("polarization")
-        self.wavelength = self.gds.listdeviceparam("wavelength")
-        self.type = self.gds.listdeviceparam("type")
-        self.devicename = [f"{name} ({num})" for name, num in zip(
-            self.gds.listdeviceparam("devicename"), self.number)]
+        (self.number, self.coordinate, self.polarization, self.wavelength,
+         self.type, names) = self.gds.listdeviceparams(
+            ["number", "coordinate", "polarization", "wavelength", "type", "devicename"])
+        self.devicename = list(map("{} ({})".format, names, self.number))
 
         self.length = len(self.number)
         self.checkbox_state = [False] * self.length
@@ -404,15 +454,11 @@ class devices(App):
             elif key == "devices_sel":
                 for i in val:
                     self.checkbox_state[i-1] = True
-                    cb = getattr(self, f"test_{i-1}", None)
-                    if cb is not None:
-                        cb.set_value(True)
+                self._sync_visible_checkboxes()
             elif key == "devices_del":
                 for i in val:
                     self.checkbox_state[i-1] = False
-                    cb = getattr(self, f"test_{i-1}", None)
-                    if cb is not None:
-                        cb.set_value(False)
+                self._sync_visible_checkboxes()
             elif key == "devices_confirm":
                 self.onclick_confirm()
 
@@ -1,9 +1,18 @@
 from remi import start, App
-import os, threading, webview
+import os, socket, threading, webview
+from functools import lru_cache
 from lib_gui import *
 
 shared_path = os.path.join("database", "shared_memory.json")
 
+# Per-row label text and dropdown options for the instrument selector rows
+INSTRUMENT_LABELS = ("Stage:", "Sensor:", "TEC:")
+INSTRUMENT_OPTIONS = (
+    ["stage_control", "stage_B", "stage_C"],
+    ["stage_control", "laser_B", "laser_C"],
+    ["stage_control", "TEC_B", "TEC_C"],
+)
+
 class instruments(App):
     def __init__(self, *args, **kwargs):
         self.configuration = {"stage": "", "sensor": "", "tec": ""}
@@ -127,18 +136,13 @@ class instruments(App):
             # Label
             StyledLabel(
                 container=instruments_container, variable_name=f"label_{key}",
-                text={"stage": "Stage:",
-                      "sensor": "Sensor:",
-                      "tec": "TEC:"}[key],
+                text=INSTRUMENT_LABELS[idx],
                 left=0, top=15 + idx * 40, width=150, height=20, font_size=100, color="#444", align="right"
             )
 
             # DropDown
             setattr(self, f"{key}_dd", StyledDropDown(
-                container=instruments_container,
-                text={"stage": ["stage_control", "stage_B", "stage_C"],
-                      "sensor": ["stage_control","laser_B","laser_C"],
-                      "tec": ["stage_control","TEC_B","TEC_C"]}[key],
+                container=instruments_container, text=INSTRUMENT_OPTIONS[idx],
                 variable_name=f"set_{key}", left=160, top=10 + idx * 40, width=180, height=30))
 
             # Configure Button
@@ -232,10 +236,10 @@ def run_remi():
         enable_file_cache=False,
     )
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Automatically detect local LAN IP address"""
     try:
-        import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Fake connect to get route IP
         ip = s.getsockname()[0]
@@ -2,6 +2,15 @@ from remi import start, App
 import os, lib_coordinates, threading, glob
 from lib_gui import *
 
+# Shared kwargs for the table row labels: every gds/stage cell uses the same
+# geometry and styling, so build the dict once instead of per widget. The
+# cells only ever show static coordinate text, so they use the plain block
+# layout instead of a flex container per cell.
+ROW_LABEL_KW = dict(
+    left=0, top=0, width=100, height=100, font_size=100, color="#222",
+    align="right", position="inherit", percent=True, static=True
+)
+
 class registration(App):
     def __init__(self, *args, **kwargs):
         self.first_mark_set = 0
@@ -14,11 +23,22 @@ class registration(App):
         self.second_mark_position = [100, -100,0]
         self.third_mark_position = [100, 100,0]
         self.memory = Memory()
+        self.terminal = None
+        self._tab_gate = ActiveTabGate("registration")
 
         if "editing_mode" not in kwargs:
             super(registration, self).__init__(*args, **{"static_file_path": {"my_res": "./res/"}})
 
     def idle(self):
+        if not self._tab_gate.is_active():
+            return
+        # Terminal is built on the first idle tick instead of in construct_ui,
+        # so first paint is not blocked by the log viewer subtree.
+        if self.terminal is None:
+            self.terminal = Terminal(
+                container=self.terminal_container, variable_name="terminal_text",
+                left=10, top=15, width=610, height=100
+            )
         self.terminal.terminal_refresh()
 
     def main(self):
@@ -29,6 +49,33 @@ class registration(App):
         thread = threading.Thread(target=target, args=args, daemon=True)
         thread.start()
 
+    def _make_row_widgets(self, row_index):
+        """Build the widget set for one coordinate table row.
+
+        Note: cloning a prototype row via copy.deepcopy does not work with
+        remi — the DOM id is derived from the widget instance, so copies
+        collide with the original in the page. Sharing one factory keeps
+        the construction in a single place instead.
+        """
+        return {
+            f"device_id_{row_index}": StyledDropDown(
+                container=None, text="N/A", variable_name=f"device_id_{row_index}",
+                bg_color="#9aa3af" if row_index % 2 != 0 else "#7b8494",
+                border="0px", border_radius="0px", left=0, top=0,
+                width=100, height=100, position="inherit", percent=True),
+            f"gds_x_{row_index}": StyledLabel(
+                container=None, text="N/A", variable_name=f"gds_x_{row_index}", **ROW_LABEL_KW),
+            f"gds_y_{row_index}": StyledLabel(
+                container=None, text="N/A", variable_name=f"gds_y_{row_index}", **ROW_LABEL_KW),
+            f"stage_x_{row_index}": StyledLabel(
+                container=None, text="N/A", variable_name=f"stage_x_{row_index}", **ROW_LABEL_KW),
+            f"stage_y_{row_index}": StyledLabel(
+                container=None, text="N/A", variable_name=f"stage_y_{row_index}", **ROW_LABEL_KW),
+            f"checkbox_{row_index}": StyledCheckBox(
+                container=None, variable_name=f"checkbox_{row_index}", left=0, top=0,
+                width=10, height=10, position="inherit"),
+        }
+
     def construct_ui(self):
         registration_container = StyledContainer(
             container=None, variable_name="registration_container", left=0, top=0
@@ -83,59 +130,27 @@ class registration(App):
         )
 
         # Initialize each row of the coordinate table with UI elements
+        table = registration_container.children["coordinate_container"].children["device_table"]
         for row_index in range(1, 4):
-            table = registration_container.children["coordinate_container"].children["device_table"]
-            row = list(table.children.values())[row_index]
-            cell0, cell1, cell2, cell3, cell4, cell5 = [list(row.children.values())[i] for i in range(6)]
-            cell5.style["text-align"] = "center"
+            row = table.children[f"row_{row_index}"]
+            cells = [row.children[f"cell_{c}"] for c in range(6)]
+            cells[5].style["text-align"] = "center"
 
-            setattr(self, f"device_id_{row_index}", StyledDropDown(
-                container=None, text="N/A", variable_name=f"device_id_{row_index}",
-                bg_color="#9aa3af" if row_index % 2 != 0 else "#7b8494",
-                border="0px", border_radius="0px", left=0, top=0,
-                width=100, height=100, position="inherit", percent=True))
-
-            setattr(self, f"gds_x_{row_index}", StyledLabel(
-                container=None, text="N/A", variable_name=f"gds_x_{row_index}", left=0, top=0,
-                width=100, height=100, font_size=100, color="#222", align="right", position="inherit",
-                percent=True, flex=True))
-
-            setattr(self, f"gds_y_{row_index}", StyledLabel(
-                container=None, text="N/A", variable_name=f"gds_y_{row_index}", left=0, top=0,
-                width=100, height=100, font_size=100, color="#222", align="right", position="inherit",
-                percent=True, flex=True))
-
-            setattr(self, f"stage_x_{row_index}", StyledLabel(
-                container=None, text="N/A", variable_name=f"stage_x_{row_index}", left=0, top=0,
-                width=100, height=100, font_size=100, color="#222", align="right", position="inherit",
-                percent=True, flex=True))
-
-            setattr(self, f"stage_y_{row_index}", StyledLabel(
-                container=None, text="N/A", variable_name=f"stage_y_{row_index}", left=0, top=0,
-                width=100, height=100, font_size=100, color="#222", align="right", position="inherit",
-                percent=True, flex=True))
-
-            setattr(self, f"checkbox_{row_index}", StyledCheckBox(
-                container=None, variable_name=f"checkbox_{row_index}", left=0, top=0,
-                width=10, height=10, position="inherit"))
+            widgets = self._make_row_widgets(row_index)
+            for name, widget in widgets.items():
+                setattr(self, name, widget)
 
             # Append widgets to the corresponding cells
-            cell0.append(getattr(self, f"device_id_{row_index}"))
-            cell1.append(getattr(self, f"gds_x_{row_index}"))
-            cell2.append(getattr(self, f"gds_y_{row_index}"))
-            cell3.append(getattr(self, f"stage_x_{row_index}"))
-            cell4.append(getattr(self, f"stage_y_{row_index}"))
-            cell5.append(getattr(self, f"checkbox_{row_index}"))
+            for cell, widget in zip(cells, widgets.values()):
+                cell.append(widget)
 
         # ---------------- Terminal Display ----------------
-        terminal_container = StyledContainer(
+        self.terminal_container = StyledContainer(
             container=registration_container, variable_name="terminal_container",
             left=0, top=500, height=150, width=650, bg_color=True
         )
 
-        self.terminal = Terminal(
-            container=terminal_container, variable_name="terminal_text", left=10, top=15, width=610, height=100
-        )
+        self.terminal = None  # created lazily in idle()
 
         # ---------------- Event Bindings ----------------
         self.uploader.ondata.do(lambda emitter, filedata, filename: self.run_in_thread(self.ondata_uploader, emitter, filedata, filename))
@@ -164,12 +179,10 @@ class registration(App):
             pass
 
         self.gds = lib_coordinates.coordinates(("./res/coordinates/" + filename), read_file=True,name="./database/coordinates.json")
-        self.number = self.gds.listdeviceparam("number")
-        self.coordinate = self.gds.listdeviceparam("coordinate")
-        self.polarization = self.gds.listdeviceparam("polarization")
-        self.wavelength = self.gds.listdeviceparam("wavelength")
-        self.type = self.gds.listdeviceparam("type")
-        self.devices = [f"{name} ({num})" for name, num in zip(self.gds.listdeviceparam("devicename"), self.number)]
+        (self.number, self.coordinate, self.polarization, self.wavelength,
+         self.type, names) = self.gds.listdeviceparams(
+            ["number", "coordinate", "polarization", "wavelength", "type", "devicename"])
+        self.devices = list(map("{} ({})".format, names, self.number))
 
         self.device_id_1.empty()
         self.device_id_2.empty()
@@ -6,7 +6,8 @@ Remi GUI — User/Mode selector with dynamic dropdown + JSON sync
 * No functional change versus the original script — only formatting / layout tidy-up
 """
 
-import json, os, shutil, threading, webview
+import json, os, shutil, socket, threading, webview
+from functools import lru_cache
 from typing import List, Union
 from remi import App, start
 from lib_gui import *
@@ -27,12 +28,24 @@ class Starts(App):
         self._last_saved_project: str = ""
         self._last_user: Union[str, List[str]] = ""
         self._last_project: Union[str, List[str]] = ""
+        self.terminal = None
+        self._tab_gate = ActiveTabGate("start")
         if "editing_mode" not in kwargs:
             super().__init__(*args, **{"static_file_path": {"my_res": "./res/"}})
 
     def idle(self) -> None:
         """Refresh terminal & sync dropdown/JSON when things change."""
-        self.terminal.terminal_refresh()
+        # Terminal upkeep only runs while this tab is visible; the user and
+        # project sync below keeps running so the shared state stays fresh.
+        if self._tab_gate.is_active():
+            # Terminal is built on the first idle tick instead of in
+            # construct_ui, so first paint is not blocked by the log viewer.
+            if self.terminal is None:
+                self.terminal = Terminal(
+                    container=self.terminal_container, variable_name="terminal_text",
+                    left=10, top=15, width=610, height=100,
+                )
+            self.terminal.terminal_refresh()
 
         now_user = tuple(self.list_user_folders())
         if getattr(self, "_last_user", None) != now_user:
@@ -139,15 +152,12 @@ class Starts(App):
             left=440, top=140, width=60, height=30, normal_color="#dc3545", press_color="#c82333",
         )
 
-        terminal_container = StyledContainer(
+        self.terminal_container = StyledContainer(
             container=starts_container, variable_name="terminal_container",
             left=0, top=500, height=150, width=650, bg_color=True,
         )
 
-        self.terminal = Terminal(
-            container=terminal_container, variable_name="terminal_text",
-            left=10, top=15, width=610, height=100,
-        )
+        self.terminal = None  # created lazily in idle()
 
         # ── event bindings
         self.add_btn.do_onclick(lambda *_: self.run_in_thread(self.onclick_add))
@@ -213,10 +223,10 @@ def run_remi():
         enable_file_cache=False,
     )
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Automatically detect local LAN IP address"""
     try:
-        import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Fake connect to get route IP
         ip = s.getsockname()[0]
@@ -1,12 +1,27 @@
 from lib_gui import *
 from remi import start, App
-import lib_coordinates, threading, math, json, os, time, webview, wx, shutil
-from lib_tsp import TSPSolver
+import threading, math, json, os, time, shutil, socket
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works the same
+    orjson = None
 
 command_path = os.path.join("database", "command.json")
 shared_path = os.path.join("database", "shared_memory.json")
 desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
 
+
+def load_json(path):
+    """Parse a JSON file, through orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+@lru_cache(maxsize=4096)
 def fmt(val):
     try:
         return f"{float(val):.2f}"
@@ -17,11 +32,26 @@ def fmt(val):
 class testing(App):
     """Testing GUI with per-device 5-second timer that updates status and elapsed/remaining time."""
 
+    # Shared by every cell built in build_table_rows; the per-column width
+    # is merged in when the cell is created.
+    _CELL_STYLE = {
+        "height": "30px",
+        "text-align": "center",
+        "border-bottom": "1px solid #ebebeb",
+        "padding": "1px 2px",
+        "overflow": "hidden",
+        "text-overflow": "ellipsis",
+        "white-space": "nowrap",
+    }
+    # Indexed by row parity, (start_i + row_idx) & 1.
+    _ROW_BG = ({"background-color": "#9aa3af"}, {"background-color": "#7b8494"})
+
     def __init__(self, *args, **kwargs):
         # ------------------------------------------------------------------ LOAD DATA
         self._user_mtime = None
         self._first_command_check = True
         self._user_stime = None
+        self._tab_gate = ActiveTabGate("testing")
         self.notopen = True
         self.running = False
         self.cur_user = ""
@@ -42,6 +72,9 @@ class testing(App):
         self.filtered_idx = []
         self.page_size = 50
         self.page_index = 0
+        # Data rows in table order, maintained as rows are appended so the
+        # render never has to copy table.children to skip the header.
+        self._data_rows = []
 
         self._last_user = ""
         self._last_user_paths = []
@@ -58,7 +91,11 @@ class testing(App):
 
     # ------------------------------------------------------------------ REMI HOOKS
     def idle(self):
-        self.terminal.terminal_refresh()
+        # Terminal upkeep only runs while this tab is visible; the command
+        # and shared-memory polling below keeps running so tests driven from
+        # other tabs still progress.
+        if self._tab_gate.is_active():
+            self.terminal.terminal_refresh()
         try:
             mtime = os.path.getmtime(command_path)
             stime = os.path.getmtime(shared_path)
@@ -80,17 +117,16 @@ class testing(App):
             self.cur_user = ""
             if stime is not None:
                 try:
-                    with open(shared_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        self.cur_user = data.get("User", "").strip()
-                        image_path = data.get("Image", "")
-                        if image_path != self.image_path:
-                            self.image_path = image_path
-                            self.display_plot.set_image(f"my_res:{self.image_path}")
-                        self.serial_list = set(data.get("Selection", []))
-                        self.device_num = data.get("DeviceNum", 0)
-                        self.auto_sweep = data.get("AutoSweep", 0)
-                        self.project = data.get("Project", "")
+                    data = load_json(shared_path)
+                    self.cur_user = data.get("User", "").strip()
+                    image_path = data.get("Image", "")
+                    if image_path != self.image_path:
+                        self.image_path = image_path
+                        self.display_plot.set_image(f"my_res:{self.image_path}")
+                    self.serial_list = set(data.get("Selection", []))
+                    self.device_num = data.get("DeviceNum", 0)
+                    self.auto_sweep = data.get("AutoSweep", 0)
+                    self.project = data.get("Project", "")
 
                 except Exception as e:
                     print(f"[Warn] read json failed: {e}")
@@ -162,10 +198,22 @@ class testing(App):
     def total_pages(self):
         return max(1, math.ceil(len(self.filtered_idx) / self.page_size))
 
+    @staticmethod
+    def _set_cell_text(cell, text, title=None):
+        """Write the cell text and tooltip, skipping unchanged values.
+
+        Every set_text goes out to the browser, so repeated renders of the
+        same page should not resend identical cell contents.
+        """
+        if getattr(cell, "_last_text", None) != text:
+            cell.set_text(text)
+            cell.attributes["title"] = text if title is None else title
+            cell._last_text = text
+
     def build_table_rows(self):
         """Re-render table rows for current page."""
         table = self.table
-        data_rows = list(table.children.values())[1:]  # children[0] is the header row
+        data_rows = self._data_rows
 
         start_i = self.page_index * self.page_size
         end_i = min(len(self.filtered_idx), start_i + self.page_size)
@@ -177,17 +225,8 @@ class testing(App):
         if needed > cur:
             for _ in range(needed - cur):
                 tr = TableRow()
-                for w in self.col_widths:
-                    tr.append(TableItem("", style={
-                        "width": f"{w}px",
-                        "height": "30px",
-                        "text-align": "center",
-                        "border-bottom": "1px solid #ebebeb",
-                        "padding": "1px 2px",
-                        "overflow": "hidden",
-                        "text-overflow": "ellipsis",
-                        "white-space": "nowrap"
-                    }))
+                for wpx in self._col_width_px:
+                    tr.append(TableItem("", style={**self._CELL_STYLE, "width": wpx}))
                 table.append(tr)
                 data_rows.append(tr)
 
@@ -195,19 +234,18 @@ class testing(App):
         for row_idx, row in enumerate(data_rows):
             if row_idx < needed:
                 global_idx = page_idx_slice[row_idx]
+                row.style["display"] = "table-row"
                 cells = list(row.children.values())
-                bg = "#9aa3af" if (start_i + row_idx) % 2 == 0 else "#7b8494"
-                for c in cells:
-                    c.style.update({"display": "table-cell", "background-color": bg})
-
-                cells[0].set_text(self.devicename[global_idx])
-                cells[0].attributes["title"] = self.devicename[global_idx]
-
-                cells[1].set_text(self.status[global_idx])
-                cells[1].attributes["title"] = self.status[global_idx]
+                bg_style = self._ROW_BG[(start_i + row_idx) & 1]
+                if getattr(row, "_last_bg", None) is not bg_style:
+                    for c in cells:
+                        c.style.update(bg_style)
+                    row._last_bg = bg_style
+
+                self._set_cell_text(cells[0], self.devicename[global_idx])
+                self._set_cell_text(cells[1], self.status[global_idx])
             else:
-                for c in row.children.values():
-                    c.style["display"] = "none"
+                row.style["display"] = "none"
 
         # update pagination widgets
         self.page_input.set_text(str(self.page_index + 1))
@@ -317,6 +355,7 @@ class testing(App):
 
         headers = ["Device", "Status"]
         self.col_widths = [100, 40]
+        self._col_width_px = tuple(f"{w}px" for w in self.col_widths)
         table_container = StyledContainer(
             container=setting_container, variable_name="setting_container",
             left=0, top=40, height=230, width=235, border=True, overflow=True
@@ -441,6 +480,8 @@ class testing(App):
 
     def tsp_solve(self):
         if self.filtered_idx:
+            from lib_tsp import TSPSolver
+
             self.tsp_btn.set_enabled(False)
             self.start_btn.set_enabled(False)
             self.stop_btn.set_enabled(False)
@@ -460,7 +501,7 @@ class testing(App):
             self.start_btn.set_enabled(True)
             self.stop_btn.set_enabled(True)
 
-            filtered = {str(i + 1): self.coordinate[i][0:2] for i in self.filtered_idx}
+            filtered = {str(i + 1): self.coordinate[i][0:2].tolist() for i in self.filtered_idx}
             self.remaining = len(filtered)
             self.elapsed = 0
             file = File("shared_memory", "Image", f"TSP/{solver.path}", "Filtered", filtered)
@@ -470,13 +511,20 @@ class testing(App):
 
     def load_file(self):
         if self.serial_list:
+            import lib_coordinates
+
             self.gds = lib_coordinates.coordinates(read_file=False, name="./database/coordinates.json")
-            self.number = self.gds.listdeviceparam("number")
-            self.coordinate = self.gds.listdeviceparam("coordinate")
-            self.polarization = self.gds.listdeviceparam("polarization")
-            self.wavelength = self.gds.listdeviceparam("wavelength")
-            self.type = self.gds.listdeviceparam("type")
-            self.devicename = [f"{name} ({num})" for name, num in zip(self.gds.listdeviceparam("devicename"), self.number)]
+            (number, coordinate, polarization, wavelength,
+             device_type, names) = self.gds.listdeviceparams(
+                ["number", "coordinate", "polarization", "wavelength", "type", "devicename"])
+            # Keep the columns as NumPy arrays (struct-of-arrays): contiguous
+            # storage and constant-time indexing when pages are rendered.
+            self.number = np.asarray(number, dtype=np.int64)
+            self.coordinate = np.asarray(coordinate, dtype=np.float64)
+            self.polarization = np.asarray(polarization, dtype=object)
+            self.wavelength = np.asarray(wavelength, dtype=object)
+            self.type = np.asarray(device_type, dtype=object)
+            self.devicename = list(map("{} ({})".format, names, number))
             self.status = ["0"] * len(self.devicename)
             self.filtered_idx = [i - 1 for i in self.serial_list]  # current filter result (list of global indices)
             self.page_size = 50
@@ -486,6 +534,8 @@ class testing(App):
             print("No device found!")
 
     def open_file_path(self):
+        import wx
+
         app = wx.App(False)
         with wx.DirDialog(None, "Select folder to save results",
                           style=wx.DD_DEFAULT_STYLE) as dlg:
@@ -539,9 +589,7 @@ class testing(App):
         new_command = {}
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                command = data.get("command", {})
+            command = load_json(path).get("command", {})
         except Exception as e:
             print(f"[Error] Failed to load command: {e}")
             return
@@ -601,6 +649,8 @@ class testing(App):
             file.save()
 
     def laser_sweep_setting(self):
+        import webview
+
         local_ip = get_local_ip()
         webview.create_window(
             "Setting",
@@ -621,10 +671,10 @@ def run_remi():
         enable_file_cache=False,
     )
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Automatically detect local LAN IP address"""
     try:
-        import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Fake connect to get route IP
         ip = s.getsockname()[0]
@@ -634,8 +684,10 @@ def get_local_ip():
         return "127.0.0.1"  # fallback
 
 
-    # --------------------------------------------------------------------------- MAIN
+# --------------------------------------------------------------------------- MAIN
 if __name__ == "__main__":
+    import webview
+
     threading.Thread(target=run_remi, daemon=True).start()
     local_ip = get_local_ip()
     webview.create_window(
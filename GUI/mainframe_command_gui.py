@@ -3,6 +3,8 @@ from remi import start, App
 import threading
 import webview
 import signal
+import socket
+from functools import lru_cache
 
 shared_path = os.path.join("database", "shared_memory.json")
 
@@ -147,10 +149,10 @@ class stage_control(App):
         except Exception as e:
             print(f"[Error] Failed to save file: {e}")
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Automatically detect local LAN IP address"""
     try:
-        import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Fake connect to get route IP
         ip = s.getsockname()[0]
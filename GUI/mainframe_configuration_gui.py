@@ -9,8 +9,10 @@ from IPython.lib.display import IFrame
 from lib_gui import *
 from remi.gui import *
 from remi import start, App, gui
-import threading, webview, signal, socket, time
+import atexit, threading, webview, signal, socket, time
+from functools import lru_cache
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -107,21 +109,40 @@ class NIR_Measurment_System(App):
             ("Testing", 9004),
         ]
 
+        # Shared by all five tabs; only src differs per frame. A copy.copy'd
+        # template widget would not work here — the DOM id is derived from
+        # the widget instance, so copies collide in the page.
+        iframe_attrs = {
+            "width": "100%",
+            "height": "100%",
+            # Let the browser defer loading the non-active tabs
+            "loading": "lazy",
+        }
+
         def make_iframe(port: int):
             w = Widget(_type="iframe", width="100%", height="100%", margin="0px")
-            w.attributes.update({
-                "src": f"http://{ip_address}:{port}",
-                "width": "100%",
-                "height": "100%",
-            })
+            w.attributes.update(iframe_attrs)
+            w.attributes["src"] = f"http://{ip_address}:{port}"
             w.style["border"] = "none"
             return w
 
+        self.tabs = {}
         for title, port in tab_cfg:
             frame = make_iframe(port)
-            setattr(self, title.lower(), frame)
+            self.tabs[title.lower()] = frame
             main_tab.add_tab(frame, title)
 
+        # Publish the selected tab so the child apps can skip their
+        # background refresh work while hidden. Guarded because the TabBox
+        # selection event is not present in every remi release. The listener
+        # receives the tab key (the title passed to add_tab), not the widget.
+        def _on_tab_selection(emitter, key):
+            File("shared_memory", "ActiveTab", str(key).lower()).save()
+
+        if hasattr(main_tab, "on_tab_selection"):
+            main_tab.on_tab_selection.do(_on_tab_selection)
+        File("shared_memory", "ActiveTab", "start").save()
+
         main.append(main_tab, "main_tab")
         self.main = main
         print("Welcome To Probe Stage")
@@ -146,6 +167,10 @@ def disable_scroll():
 
 
 if __name__ == '__main__':
+    # Clear the published tab on exit so the child apps are not gated by a
+    # stale ActiveTab value when they later run standalone.
+    atexit.register(lambda: File("shared_memory", "ActiveTab", None).save())
+
     local_ip = get_local_ip()
 
     threading.Thread(target=run_remi, daemon=True).start()
@@ -1,7 +1,8 @@
 from lib_gui import *
 from remi.gui import *
 from remi import start, App
-import threading, webview, signal, datetime
+import threading, webview, signal, datetime, socket
+from functools import lru_cache
 import pandas as pd
 
 command_path = os.path.join("database", "command.json")
@@ -374,10 +375,10 @@ class stage_control(App):
             file = File("command", "command", new_command)
             file.save()
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Automatically detect local LAN IP address"""
     try:
-        import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Fake connect to get route IP
         ip = s.getsockname()[0]
@@ -1,7 +1,8 @@
 from lib_gui import *
 from remi.gui import *
 from remi import start, App
-import threading, webview, signal, lib_coordinates, asyncio, datetime
+import threading, webview, signal, lib_coordinates, asyncio, datetime, socket
+from functools import lru_cache
 from motors.stage_manager import StageManager
 from motors.config.stage_config import StageConfiguration
 from NIR.nir_manager import NIRManager
@@ -226,12 +227,10 @@ class stage_control(App):
             "stage"] == 0:
             self.gds = lib_coordinates.coordinates(("./res/" + filename), read_file=False,
                                                    name="./database/coordinates.json")
-            self.number = self.gds.listdeviceparam("number")
-            self.coordinate = self.gds.listdeviceparam("coordinate")
-            self.polarization = self.gds.listdeviceparam("polarization")
-            self.wavelength = self.gds.listdeviceparam("wavelength")
-            self.type = self.gds.listdeviceparam("type")
-            self.devices = [f"{name} ({num})" for name, num in zip(self.gds.listdeviceparam("devicename"), self.number)]
+            (self.number, self.coordinate, self.polarization, self.wavelength,
+             self.type, names) = self.gds.listdeviceparams(
+                ["number", "coordinate", "polarization", "wavelength", "type", "devicename"])
+            self.devices = list(map("{} ({})".format, names, self.number))
 
             self.memory = Memory()
             self.configure = StageConfiguration()
@@ -591,9 +590,9 @@ class stage_control(App):
         position_unit = ["um", "um", "um", "deg", "deg"]
         init_value = ["10.0", "10.0", "10.0", "0.1", "0.1"]
 
-        for i in range(5):
-            prefix = var_prefixes[i]
-            top = ROW_TOPS[i]
+        for prefix, top, label, la, ra, pos_text, unit, init in zip(
+                var_prefixes, ROW_TOPS, labels, left_arrows, right_arrows,
+                position_texts, position_unit, init_value):
 
             # per-axis lock checkbox (aligned with header icon)
             setattr(self, f"{prefix}_lock", StyledCheckBox(
@@ -603,14 +602,14 @@ class stage_control(App):
 
             # axis label (left column)
             StyledLabel(
-                container=xyz_container, text=labels[i], variable_name=f"{prefix}_label",
+                container=xyz_container, text=label, variable_name=f"{prefix}_label",
                 left=LABEL_LEFT, top=top, width=55, height=ROW_H,
                 font_size=100, color="#222", flex=True, bold=True, justify_content="center"
             )
 
             # position readout + unit (next column)
             setattr(self, f"{prefix}_position_lb", StyledLabel(
-                container=xyz_container, text=position_texts[i], variable_name=f"{prefix}_position_lb",
+                container=xyz_container, text=pos_text, variable_name=f"{prefix}_position_lb",
                 left=POS_LEFT+50, top=top, width=70, height=ROW_H, font_size=100, color="#222",
                 flex=True, bold=True, justify_content="left"
             ))
@@ -620,22 +619,22 @@ class stage_control(App):
                 flex=True, justify_content="right"
             ))
             setattr(self, f"{prefix}_position_unit", StyledLabel(
-                container=xyz_container, text=position_unit[i], variable_name=f"{prefix}_position_unit",
+                container=xyz_container, text=unit, variable_name=f"{prefix}_position_unit",
                 left=UNIT_LEFT, top=top, width=40, height=ROW_H, font_size=100, color="#222",
                 flex=True, bold=True, justify_content="left"
             ))
 
             # jog controls (shifted right)
             setattr(self, f"{prefix}_left_btn", StyledButton(
-                container=xyz_container, text=left_arrows[i], variable_name=f"{prefix}_left_button", font_size=100,
+                container=xyz_container, text=la, variable_name=f"{prefix}_left_button", font_size=100,
                 left=BTN_L_LEFT, top=top, width=50, height=ROW_H, normal_color="#007BFF", press_color="#0056B3"
             ))
             setattr(self, f"{prefix}_input", StyledSpinBox(
                 container=xyz_container, variable_name=f"{prefix}_step", min_value=0, max_value=1000,
-                value=init_value[i], step=0.1, left=SPIN_LEFT, top=top, width=73, height=ROW_H, position="absolute"
+                value=init, step=0.1, left=SPIN_LEFT, top=top, width=73, height=ROW_H, position="absolute"
             ))
             setattr(self, f"{prefix}_right_btn", StyledButton(
-                container=xyz_container, text=right_arrows[i], variable_name=f"{prefix}_right_button", font_size=100,
+                container=xyz_container, text=ra, variable_name=f"{prefix}_right_button", font_size=100,
                 left=BTN_R_LEFT, top=top, width=50, height=ROW_H, normal_color="#007BFF", press_color="#0056B3"
             ))
 
@@ -1173,12 +1172,10 @@ class stage_control(App):
     def onclick_load(self):
         self.gds = lib_coordinates.coordinates(("./res/" + filename), read_file=False,
                                                name="./database/coordinates.json")
-        self.number = self.gds.listdeviceparam("number")
-        self.coordinate = self.gds.listdeviceparam("coordinate")
-        self.polarization = self.gds.listdeviceparam("polarization")
-        self.wavelength = self.gds.listdeviceparam("wavelength")
-        self.type = self.gds.listdeviceparam("type")
-        self.devices = [f"{name} ({num})" for name, num in zip(self.gds.listdeviceparam("devicename"), self.number)]
+        (self.number, self.coordinate, self.polarization, self.wavelength,
+         self.type, names) = self.gds.listdeviceparams(
+            ["number", "coordinate", "polarization", "wavelength", "type", "devicename"])
+        self.devices = list(map("{} ({})".format, names, self.number))
 
         self.move_dd.empty()
         self.move_dd.append(self.devices)
@@ -1438,10 +1435,10 @@ class stage_control(App):
             file.save()
 
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Automatically detect local LAN IP address"""
     try:
-        import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Fake connect to get route IP
         ip = s.getsockname()[0]
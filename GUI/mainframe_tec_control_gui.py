@@ -2,6 +2,7 @@ from lib_gui import *
 from remi.gui import *
 from remi import start, App
 import threading, webview, signal, socket
+from functools import lru_cache
 from LDC.ldc_manager import LDCManager
 from LDC.config.ldc_config import LDCConfiguration
 
@@ -224,10 +225,10 @@ class tec_control(App):
             file = File("command", "command", new_command)
             file.save()
 
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Automatically detect local LAN IP address"""
     try:
-        import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))  # Fake connect to get route IP
         ip = s.getsockname()[0]
@@ -0,0 +1,143 @@
+"""
+Quick-look plotter for the CSV spectra written by the sweep apps
+----------------------------------------------------------------
+Usage:
+    python plot_csv.py UserData/Guest/Project1/Spectrum/dev/sweep.csv
+    python plot_csv.py sweep.csv -y "Detector 1" "Detector 2" --save out.png
+
+Loads the CSV with pandas (multi-threaded pyarrow engine when it is
+installed), picks the x column and the numeric y columns, then shows
+the figure or writes it to disk when --save is given.
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Plot columns of a CSV file")
+    parser.add_argument("csv", help="CSV file to plot")
+    parser.add_argument("-d", "--delimiter", default=",", help="field delimiter")
+    parser.add_argument("-x", help="x column name (default: first column)")
+    parser.add_argument("-y", nargs="+", help="y column names (default: every numeric column)")
+    parser.add_argument("--no-header", action="store_true", help="file has no header row")
+    parser.add_argument("--save", help="write the figure here instead of showing it")
+    parser.add_argument("--downsample", type=int, metavar="N",
+                        help="keep roughly N evenly spaced points per column")
+    return parser.parse_args(argv)
+
+
+def load_frame(args):
+    header = None if args.no_header else 0
+
+    usecols = None
+    dtype = None
+    if args.y:
+        # Read only the header line to validate the requested columns,
+        # then parse just those columns with a fixed dtype: pandas skips
+        # type inference and never materializes the other fields.
+        names = pd.read_csv(args.csv, sep=args.delimiter, header=header, nrows=0).columns
+        x_col = args.x if args.x is not None else names[0]
+        missing = [c for c in [x_col, *args.y] if c not in names]
+        if missing:
+            sys.exit(f"Columns not found: {missing}")
+        usecols = [x_col, *args.y]
+        dtype = {c: "float64" for c in args.y}
+
+    kwargs = dict(sep=args.delimiter, header=header, usecols=usecols, dtype=dtype)
+    try:
+        return pd.read_csv(args.csv, engine="pyarrow", **kwargs)
+    except (ImportError, ValueError):
+        # pyarrow missing or an option it does not support; the default
+        # engine handles everything, just single-threaded.
+        return pd.read_csv(args.csv, **kwargs)
+
+
+def plot_stream(args, ax):
+    """Plot the file chunk by chunk so peak memory stays bounded.
+
+    Used for save-only runs with explicit -y columns: no interactive
+    zoom needs the full arrays, the columns are known without type
+    inference, and files larger than RAM still plot.
+    """
+    from matplotlib.lines import Line2D
+
+    header = None if args.no_header else 0
+    names = pd.read_csv(args.csv, sep=args.delimiter, header=header, nrows=0).columns
+    x_col = args.x if args.x is not None else names[0]
+    y_cols = list(args.y)
+    missing = [c for c in [x_col, *y_cols] if c not in names]
+    if missing:
+        sys.exit(f"Columns not found: {missing}")
+
+    # Fixed color per column so every chunk of a line matches; the
+    # legend is built from proxy lines to avoid one entry per chunk.
+    colors = {c: f"C{i % 10}" for i, c in enumerate(y_cols)}
+    chunks = pd.read_csv(args.csv, sep=args.delimiter, header=header,
+                         usecols=[x_col, *y_cols],
+                         dtype={c: "float64" for c in y_cols},
+                         chunksize=1_000_000)
+    for chunk in chunks:
+        x = chunk[x_col].to_numpy()
+        for c in y_cols:
+            ax.plot(x, chunk[c].to_numpy(), color=colors[c])
+    ax.legend(handles=[Line2D([], [], color=colors[c], label=str(c)) for c in y_cols])
+    return x_col
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Pick the backend before pyplot is imported: a save-only run never
+    # opens a window, so Agg skips initializing a GUI toolkit entirely.
+    import matplotlib
+    if args.save:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+
+    if args.save and args.y and not args.downsample:
+        x_col = plot_stream(args, ax)
+    else:
+        df = load_frame(args)
+
+        x_col = args.x if args.x is not None else df.columns[0]
+        if args.y:
+            y_cols = list(args.y)  # validated in load_frame
+        else:
+            # Checking the already-inferred dtypes avoids the full column
+            # sweep select_dtypes would do on wide frames.
+            y_cols = [c for c, t in df.dtypes.items()
+                      if c != x_col and pd.api.types.is_numeric_dtype(t)]
+        if not y_cols:
+            sys.exit("No numeric columns to plot")
+
+        x = df[x_col].to_numpy()
+        ys = df[y_cols].to_numpy()
+        if args.downsample and len(x) > args.downsample:
+            step = len(x) // args.downsample
+            x = x[::step]
+            ys = ys[::step]
+
+        # One plot call with a 2D array batches the line setup and runs a
+        # single autoscale pass instead of one per column.
+        lines = ax.plot(x, ys)
+        for line, c in zip(lines, y_cols):
+            line.set_label(str(c))
+        ax.legend()
+
+    ax.set_xlabel(str(x_col))
+    ax.set_ylabel("Power [dBm]")
+    ax.grid(True)
+
+    if args.save:
+        fig.savefig(args.save, dpi=300)
+        print(f"Saved {args.save}")
+    else:
+        plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import sys, pathlib, subprocess, threading, os, time, platform, signal
+import sys, pathlib, subprocess, threading, os, time, platform, signal, atexit
 
 # ────────── Configuration ───────────
 BASE_DIR = pathlib.Path(__file__).resolve().parent
@@ -30,14 +30,23 @@ class LastNFileLogger:
 
     def _open(self):
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        # 行缓冲，文本模式
-        self._fh = open(self.path, 'a', buffering=1, encoding=self.encoding, newline='')
+        # Block-buffered: one write() syscall per ~1 MiB instead of per line.
+        # Flushed explicitly on compaction, close and interpreter exit.
+        self._fh = open(self.path, 'a', buffering=1 << 20, encoding=self.encoding, newline='')
 
     def _ensure_open(self):
         if self._fh is None or self._fh.closed:
             # 防御性重开
             self._open()
 
+    def flush(self):
+        with self._lock:
+            try:
+                if self._fh and not self._fh.closed:
+                    self._fh.flush()
+            except Exception:
+                pass
+
     def close(self):
         with self._lock:
             try:
@@ -76,7 +85,6 @@ class LastNFileLogger:
             except ValueError:
                 self._open()
                 self._fh.write(s)
-            self._fh.flush()
             self._line_count += 1
             if self._line_count >= self.threshold:
                 self._compact_locked()
@@ -106,6 +114,12 @@ class LastNFileLogger:
         return [ln.rstrip('\r\n') for ln in lines[-n:]]
 
     def _compact_locked(self):
+        # Push buffered lines to disk so the tail read sees them
+        try:
+            if self._fh and not self._fh.closed:
+                self._fh.flush()
+        except Exception:
+            pass
         tail = self._read_last_lines(self.keep)
 
         try:
@@ -139,6 +153,7 @@ class LastNFileLogger:
         self._line_count = len(tail)
 
 FILE_LOG = LastNFileLogger(LOG_FILE, keep_lines=KEEP_LINES, threshold=TRIM_THRESHOLD)
+atexit.register(FILE_LOG.flush)
 
 # Track subprocesses globally
 processes = []
@@ -170,7 +185,19 @@ def _pump_output(proc: subprocess.Popen):
         FILE_LOG.write_line(f"[launcher] output reader error: {e!r}")
 
 def start_gui(path: pathlib.Path):
-    env = {**os.environ, "REM_MULTI_INST": "1", "PYTHONUNBUFFERED": "1"}
+    # Pin math libraries to one thread per GUI: with every spawned GUI
+    # otherwise starting cpu_count() BLAS/OpenMP workers, the launcher
+    # oversubscribes the machine badly. A GUI that really needs parallel
+    # math can override these in its own environment.
+    env = {
+        **os.environ,
+        "REM_MULTI_INST": "1",
+        "PYTHONUNBUFFERED": "1",
+        "OMP_NUM_THREADS": "1",
+        "OPENBLAS_NUM_THREADS": "1",
+        "MKL_NUM_THREADS": "1",
+        "NUMEXPR_NUM_THREADS": "1",
+    }
     creation = subprocess.CREATE_NEW_PROCESS_GROUP if platform.system() == "Windows" else 0
     proc = subprocess.Popen(
         [PY, "-u", str(path)],
@@ -227,6 +254,7 @@ def main():
             th.join()
     except KeyboardInterrupt:
         terminate_all()
+        FILE_LOG.flush()
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,6 @@
 import ctypes
 import numpy as np
 import pyvisa
-import pandas as pd
 from ctypes import c_double, c_int32, c_uint32, c_char, c_char_p, POINTER, byref, create_string_buffer  # <<< added c_char, create_string_buffer
 import time
 
@@ -221,11 +220,15 @@ class HP816xLambdaScan:
         }
 
     def save_csv(self, data, filename):
-        df = pd.DataFrame({
-            'Wavelength_nm': data['wavelengths_nm'],
-            'Power_dBm': data['powers_dbm']
-        })
-        df.to_csv(filename, index=False)
+        # numpy writes the two columns directly; no need to pull in pandas
+        np.savetxt(
+            filename,
+            np.column_stack((data['wavelengths_nm'], data['powers_dbm'])),
+            delimiter=',',
+            header='Wavelength_nm,Power_dBm',
+            comments='',
+            fmt='%.9g'
+        )
 
     def disconnect(self):
         if self.session:
@@ -4,6 +4,7 @@ import pyvisa
 import pandas as pd
 from ctypes import c_double, c_int32, c_uint32, c_char, c_char_p, POINTER, byref, create_string_buffer
 from tqdm import tqdm
+from contextlib import contextmanager
 import time
 
 import logging
@@ -71,6 +72,28 @@ class HP816xLambdaScan:
         ]
         self.lib.hp816x_getLambdaScanResult.restype = c_int32
 
+    @contextmanager
+    def _fast_section(self):
+        """
+        Suspend per-call error polling for a tight run of driver calls.
+
+        connect() enables errorQueryDetect, which appends a SYST:ERR?
+        query to every driver call — roughly doubling GPIB traffic in the
+        scan hot path. Inside this block polling is off; on exit the
+        error queue is drained once and polling is restored.
+        """
+        self.lib.hp816x_errorQueryDetect(self.session, 0)  # VI_FALSE
+        try:
+            yield
+        finally:
+            inst_code = c_int32(0)
+            buf = create_string_buffer(256)
+            self.lib.hp816x_error_query(self.session, byref(inst_code), buf)
+            if inst_code.value != 0:
+                logging.warning(f"[LSC] Instrument error {inst_code.value}: "
+                                f"{buf.value.decode(errors='replace')}")
+            self.lib.hp816x_errorQueryDetect(self.session, 1)  # VI_TRUE
+
     def _err_msg(self, status):
         if not self.session:
             return f"(no session) status={status}"
@@ -116,8 +139,18 @@ class HP816xLambdaScan:
 
     def lambda_scan_mf(self, start_nm: float = 1490, stop_nm: float = 1600, step_pm: float = 0.5,
                        power_dbm: float = 3.0, num_scans: int = 0, channels: list = [0, 1]):
+        """
+        Multiframe lambda scan stitched onto a uniform grid.
+
+        num_scans follows the hp816x driver convention: 0 means a single
+        pass, 1..3 request repeat scans that the mainframe averages in
+        firmware. Pass it through rather than averaging in Python — the
+        firmware loop avoids N GPIB round-trips per point.
+        """
         if not self.session:
             raise RuntimeError("Not connected to instrument")
+        if not 0 <= num_scans <= 3:
+            raise ValueError(f"num_scans must be 0..3 (driver firmware averaging), got {num_scans}")
         ##############################################################
         # Addendum
         # To obtain a higher precision, the Tunable Laser Source
@@ -174,6 +207,13 @@ class HP816xLambdaScan:
         # Preallocate outputs
         out_by_ch = {ch: np.full(n_target, np.nan, dtype=np.float64) for ch in channels}
 
+        # Driver-facing buffers: NumPy owns the memory and the driver writes
+        # straight into it, so no ctypes->numpy copy is needed per segment
+        wl_np = np.empty(max_points_per_scan, dtype=np.float64)
+        wl_ptr = wl_np.ctypes.data_as(POINTER(c_double))
+        pwr_np = np.empty(max_points_per_scan, dtype=np.float64)
+        pwr_ptr = pwr_np.ctypes.data_as(POINTER(c_double))
+
         # Segment loop
         bottom = float(start_nm)
         for seg in tqdm(range(segments), desc="Lambda Scan Stitching", unit="seg"):
@@ -184,57 +224,66 @@ class HP816xLambdaScan:
             bottom_r = bottom
             top_r = top
 
-            num_points_seg = c_uint32()
-            num_arrays_seg = c_uint32()
-            result = self.lib.hp816x_prepareMfLambdaScan(
-                self.session,
-                0,  # dBm
-                power_dbm,
-                0,  # High power
-                num_scans,
-                len(channels),  # expose all requested arrays
-                bottom_r * 1e-9,
-                top_r * 1e-9,
-                step_pm * 1e-12,
-                byref(num_points_seg),
-                byref(num_arrays_seg)
-            )
-            if result != 0:
-                raise RuntimeError(f"Prepare scan failed: {result} :: {self._err_msg(result)}")
-
-            points_seg = int(num_points_seg.value)
-            wavelengths_seg = (c_double * points_seg)()
-
-            result = self.lib.hp816x_executeMfLambdaScan(self.session, wavelengths_seg)
-            if result != 0:
-                raise RuntimeError(f"Execute scan failed: {result} :: {self._err_msg(result)}")
-
-            # Wavelengths (nm), guard trim, grid index map
-            wl_seg_nm_full = np.ctypeslib.as_array(wavelengths_seg, shape=(points_seg,)).astype(np.float64) * 1e9
-            mask = (wl_seg_nm_full >= bottom_r - 1e-6) & (wl_seg_nm_full <= top_r + 1e-6)
-            if not np.any(mask):
-                bottom = top + step_nm
-                continue
-            wl_seg_nm = wl_seg_nm_full[mask]
-            idx = np.rint((wl_seg_nm - float(start_nm)) / step_nm).astype(np.int64)
-            valid = (idx >= 0) & (idx < n_target)
-            idx = idx[valid]
-
-            # Per-array fetch into preallocated grid
-            for ch in channels:
-                buf = (c_double * points_seg)()
-                res = self.lib.hp816x_getLambdaScanResult(self.session, int(ch), 1, -90.0, buf, wavelengths_seg)
-                if res != 0:
+            with self._fast_section():
+                num_points_seg = c_uint32()
+                num_arrays_seg = c_uint32()
+                result = self.lib.hp816x_prepareMfLambdaScan(
+                    self.session,
+                    0,  # dBm
+                    power_dbm,
+                    0,  # High power
+                    num_scans,
+                    len(channels),  # expose all requested arrays
+                    bottom_r * 1e-9,
+                    top_r * 1e-9,
+                    step_size,
+                    byref(num_points_seg),
+                    byref(num_arrays_seg)
+                )
+                if result != 0:
+                    raise RuntimeError(f"Prepare scan failed: {result} :: {self._err_msg(result)}")
+
+                points_seg = int(num_points_seg.value)
+                if points_seg > max_points_per_scan:
+                    # The execute call writes points_seg doubles into the
+                    # preallocated buffers; never let it run past them.
+                    raise RuntimeError(
+                        f"Prepare scan returned {points_seg} points, "
+                        f"buffer holds {max_points_per_scan}"
+                    )
+
+                result = self.lib.hp816x_executeMfLambdaScan(self.session, wl_ptr)
+                if result != 0:
+                    raise RuntimeError(f"Execute scan failed: {result} :: {self._err_msg(result)}")
+
+                # Wavelengths (nm), guard trim, grid index map
+                # Returned grid is sorted ascending, so the guard/overlap samples can be
+                # dropped with two O(log n) searchsorted probes instead of a boolean mask.
+                wl_seg_nm_full = wl_np[:points_seg] * 1e9
+                lo = np.searchsorted(wl_seg_nm_full, bottom_r - 1e-6, side='left')
+                hi = np.searchsorted(wl_seg_nm_full, top_r + 1e-6, side='right')
+                if lo >= hi:
+                    bottom = top + step_nm
                     continue
-                pwr_full = np.ctypeslib.as_array(buf, shape=(points_seg,)).astype(np.float64)
-                pwr_seg = pwr_full[mask][valid]
-                if pwr_seg.size != idx.size:
-                    m = min(pwr_seg.size, idx.size)
-                    if m <= 0:
+                wl_seg_nm = wl_seg_nm_full[lo:hi]
+                idx = np.rint((wl_seg_nm - float(start_nm)) / step_nm).astype(np.int64)
+                valid = (idx >= 0) & (idx < n_target)
+                idx = idx[valid]
+
+                # Per-array fetch into preallocated grid
+                for ch in channels:
+                    res = self.lib.hp816x_getLambdaScanResult(self.session, int(ch), 1, -90.0, pwr_ptr, wl_ptr)
+                    if res != 0:
                         continue
-                    out_by_ch[ch][idx[:m]] = pwr_seg[:m]
-                else:
-                    out_by_ch[ch][idx] = pwr_seg
+                    # fancy-indexing below copies out of the shared buffer
+                    pwr_seg = pwr_np[lo:hi][valid]
+                    if pwr_seg.size != idx.size:
+                        m = min(pwr_seg.size, idx.size)
+                        if m <= 0:
+                            continue
+                        out_by_ch[ch][idx[:m]] = pwr_seg[:m]
+                    else:
+                        out_by_ch[ch][idx] = pwr_seg
 
             if top >= float(stop_nm) - 1e-12:
                 break
@@ -257,8 +306,18 @@ class HP816xLambdaScan:
 
     def lambda_scan(self, start_nm: float = 1490, stop_nm: float = 1600, step_pm: float = 0.5,
                     power_dbm: float = 3.0, num_scans: int = 0, channels: list = [1, 2]):
+        """
+        Single-frame lambda scan stitched onto a uniform grid.
+
+        num_scans: 0 = one pass, 1..3 = repeat scans averaged by the
+        instrument firmware (far cheaper than re-running the scan from
+        Python). Each stitched segment forwards the same value to
+        prepareLambdaScan.
+        """
         if not self.session:
             raise RuntimeError("Not connected to instrument")
+        if not 0 <= num_scans <= 3:
+            raise ValueError(f"num_scans must be 0..3 (driver firmware averaging), got {num_scans}")
 
         # Constrain to instrument limits
         start_nm = 1490 if start_nm < 1490 else start_nm
@@ -293,6 +352,14 @@ class HP816xLambdaScan:
         # Preallocate outputs
         out_by_ch = {ch: np.full(n_target, np.nan, dtype=np.float64) for ch in channels}
 
+        # Driver-facing buffers: NumPy owns the memory and the driver writes
+        # straight into it, so no ctypes->numpy copy is needed per segment.
+        # One row per possible power array (driver supports up to 8).
+        wl_np = np.empty(max_points_per_scan, dtype=np.float64)
+        wl_ptr = wl_np.ctypes.data_as(POINTER(c_double))
+        pwr_np = np.empty((8, max_points_per_scan), dtype=np.float64)
+        pwr_ptrs = [pwr_np[i].ctypes.data_as(POINTER(c_double)) for i in range(8)]
+
         bottom = float(start_nm)
         for seg in tqdm(range(segments), desc="Lambda Scan Stitching", unit="seg"):
             if self._cancel:
@@ -304,94 +371,79 @@ class HP816xLambdaScan:
             bottom_r = bottom
             top_r = top
 
-            # -------- SINGLE-FRAME PREP --------
-            num_points_seg = c_uint32()
-            num_arrays_seg = c_uint32()
-            result = self.lib.hp816x_prepareLambdaScan(
-                self.session,
-                0,  # powerUnit: 0=dBm
-                c_double(power_dbm),  # TLS setpoint
-                0,  # opticalOutput: 0=HIGHPOW (change if LOWSSE/BHR/BLR)
-                c_int32(num_scans),  # 0->1 scan, 1->2 scans, etc.
-                c_int32(len(channels)),  # PWMChannels = COUNT (NOT a mask)
-                c_double(bottom_r * 1e-9),
-                c_double(top_r * 1e-9),
-                c_double(step_pm * 1e-12),
-                byref(num_points_seg),
-                byref(num_arrays_seg)
-            )
-            if result != 0:
-                raise RuntimeError(f"Prepare scan failed: {result} :: {self._err_msg(result)}")
-
-            points_seg = int(num_points_seg.value)
-            C = int(num_arrays_seg.value)
-            if C < 1:
-                # Nothing enabled; skip this segment
-                bottom = top + step_nm
-                continue
-            if C != len(channels):
-                pass
-
-            # -------- ALLOCATE BUFFERS FOR EXECUTE --------
-            wl_buf = (c_double * points_seg)()
-
-            # Prepare up to 8 power array pointers; fill first C, NULL the rest
-            power_slots = [None] * 8
-            power_arrays = {}
-            for i in range(C):  # i: 0..C-1 maps to powerArray1..C
-                arr = (c_double * points_seg)()
-                power_slots[i] = arr
-                power_arrays[i + 1] = arr  # keep by slot index (1-based)
-
-            # Helper: NULL pointer for unused arrays
-            from ctypes import POINTER
-            def ptr_or_null(arr):
-                return arr if arr is not None else POINTER(c_double)()
-
-            # -------- SINGLE-FRAME EXECUTE (returns wl + all channels at once) --------
-            result = self.lib.hp816x_executeLambdaScan(
-                self.session,
-                wl_buf,
-                ptr_or_null(power_slots[0]),
-                ptr_or_null(power_slots[1]),
-                ptr_or_null(power_slots[2]),
-                ptr_or_null(power_slots[3]),
-                ptr_or_null(power_slots[4]),
-                ptr_or_null(power_slots[5]),
-                ptr_or_null(power_slots[6]),
-                ptr_or_null(power_slots[7]),
-            )
-            if result != 0:
-                raise RuntimeError(f"Execute scan failed: {result} :: {self._err_msg(result)}")
-
-            # -------- Convert wl + guard-trim + index into global grid --------
-            wl_seg_nm_full = np.ctypeslib.as_array(wl_buf, shape=(points_seg,)).copy() * 1e9
-            # Keep only [bottom_r, top_r] (drop 90 pm guards)
-            mask = (wl_seg_nm_full >= bottom_r - 1e-6) & (wl_seg_nm_full <= top_r + 1e-6)
-            if not np.any(mask):
-                bottom = top + step_nm
-                continue
-
-            wl_seg_nm = wl_seg_nm_full[mask]
-            idx = np.rint((wl_seg_nm - float(start_nm)) / step_nm).astype(np.int64)
-            valid = (idx >= 0) & (idx < n_target)
-            idx = idx[valid]
-
-            # -------- Map slot order (1..C) to 'channels' labels --------
-            # Example: if channels=[2,4], powerArray1->ch=2, powerArray2->ch=4
-            for slot_i, ch_label in enumerate(channels, start=1):
-                if slot_i > C:
-                    break
-                arr = power_arrays[slot_i]
-                pwr_full = np.ctypeslib.as_array(arr, shape=(points_seg,)).copy()  # copy: decouple
-                pwr_seg = pwr_full[mask][valid]
-
-                if pwr_seg.size != idx.size:
-                    m = min(pwr_seg.size, idx.size)
-                    if m > 0:
-                        out_by_ch[ch_label][idx[:m]] = pwr_seg[:m]
-                else:
-                    out_by_ch[ch_label][idx] = pwr_seg
+            with self._fast_section():
+                # -------- SINGLE-FRAME PREP --------
+                num_points_seg = c_uint32()
+                num_arrays_seg = c_uint32()
+                result = self.lib.hp816x_prepareLambdaScan(
+                    self.session,
+                    0,  # powerUnit: 0=dBm
+                    c_double(power_dbm),  # TLS setpoint
+                    0,  # opticalOutput: 0=HIGHPOW (change if LOWSSE/BHR/BLR)
+                    c_int32(num_scans),  # 0->1 scan, 1->2 scans, etc.
+                    c_int32(len(channels)),  # PWMChannels = COUNT (NOT a mask)
+                    c_double(bottom_r * 1e-9),
+                    c_double(top_r * 1e-9),
+                    c_double(step_m),
+                    byref(num_points_seg),
+                    byref(num_arrays_seg)
+                )
+                if result != 0:
+                    raise RuntimeError(f"Prepare scan failed: {result} :: {self._err_msg(result)}")
+
+                points_seg = int(num_points_seg.value)
+                if points_seg > max_points_per_scan:
+                    # The execute call writes points_seg doubles into the
+                    # preallocated buffers; never let it run past them.
+                    raise RuntimeError(
+                        f"Prepare scan returned {points_seg} points, "
+                        f"buffer holds {max_points_per_scan}"
+                    )
+                C = int(num_arrays_seg.value)
+                if C < 1:
+                    # Nothing enabled; skip this segment
+                    bottom = top + step_nm
+                    continue
+                if C != len(channels):
+                    pass
+
+                # -------- SINGLE-FRAME EXECUTE (returns wl + all channels at once) --------
+                # First C slots point at the preallocated rows; NULL the rest
+                null_ptr = POINTER(c_double)()
+                slot_ptrs = [pwr_ptrs[i] if i < C else null_ptr for i in range(8)]
+                result = self.lib.hp816x_executeLambdaScan(self.session, wl_ptr, *slot_ptrs)
+                if result != 0:
+                    raise RuntimeError(f"Execute scan failed: {result} :: {self._err_msg(result)}")
+
+                # -------- Convert wl + guard-trim + index into global grid --------
+                wl_seg_nm_full = wl_np[:points_seg] * 1e9
+                # Keep only [bottom_r, top_r] (drop 90 pm guards); the grid is sorted
+                # ascending, so two searchsorted probes replace the boolean mask.
+                lo = np.searchsorted(wl_seg_nm_full, bottom_r - 1e-6, side='left')
+                hi = np.searchsorted(wl_seg_nm_full, top_r + 1e-6, side='right')
+                if lo >= hi:
+                    bottom = top + step_nm
+                    continue
+
+                wl_seg_nm = wl_seg_nm_full[lo:hi]
+                idx = np.rint((wl_seg_nm - float(start_nm)) / step_nm).astype(np.int64)
+                valid = (idx >= 0) & (idx < n_target)
+                idx = idx[valid]
+
+                # -------- Map slot order (1..C) to 'channels' labels --------
+                # Example: if channels=[2,4], powerArray1->ch=2, powerArray2->ch=4
+                for slot_i, ch_label in enumerate(channels, start=1):
+                    if slot_i > C:
+                        break
+                    # fancy-indexing copies out of the shared buffer row
+                    pwr_seg = pwr_np[slot_i - 1, lo:hi][valid]
+
+                    if pwr_seg.size != idx.size:
+                        m = min(pwr_seg.size, idx.size)
+                        if m > 0:
+                            out_by_ch[ch_label][idx[:m]] = pwr_seg[:m]
+                    else:
+                        out_by_ch[ch_label][idx] = pwr_seg
 
             if top >= float(stop_nm) - 1e-12:
                 break
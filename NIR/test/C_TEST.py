@@ -37,7 +37,7 @@ class TestResults:
                 print(f"  - {error}")
         print(f"{'='*60}")
 
-async def test_connection(controller, results):
+def test_connection(controller, results):
     """Test connection and disconnection"""
     print("\n🔌 Testing Connection Management")
     print("-" * 40)
@@ -70,7 +70,7 @@ async def test_connection(controller, results):
         results.fail_test("Connection management", str(e))
         return False
 
-async def test_wavelength_operations(controller, results):
+def test_wavelength_operations(controller, results):
     """Test wavelength-related operations"""
     print("\n📡 Testing Wavelength Operations")
     print("-" * 40)
@@ -116,7 +116,7 @@ async def test_wavelength_operations(controller, results):
     except Exception as e:
         results.fail_test("Wavelength operations", str(e))
 
-async def test_power_operations(controller, results):
+def test_power_operations(controller, results):
     """Test power-related operations"""
     print("\n⚡ Testing Power Operations")
     print("-" * 40)
@@ -167,7 +167,7 @@ async def test_power_operations(controller, results):
     except Exception as e:
         results.fail_test("Power operations", str(e))
 
-async def test_output_control(controller, results):
+def test_output_control(controller, results):
     """Test output enable/disable"""
     print("\n🔦 Testing Output Control")
     print("-" * 40)
@@ -204,7 +204,7 @@ async def test_output_control(controller, results):
     except Exception as e:
         results.fail_test("Output control", str(e))
 
-async def test_sweep_operations(controller, results):
+def test_sweep_operations(controller, results):
     """Test sweep functionality"""
     print("\n🌊 Testing Sweep Operations")
     print("-" * 40)
@@ -268,7 +268,7 @@ async def test_sweep_operations(controller, results):
     except Exception as e:
         results.fail_test("Sweep operations", str(e))
 
-async def test_detector_operations(controller, results):
+def test_detector_operations(controller, results):
     """Test detector/power measurement operations"""
     print("\n📊 Testing Detector Operations")
     print("-" * 40)
@@ -370,7 +370,7 @@ async def test_logging_operations(controller, results):
     except Exception as e:
         results.fail_test("Logging operations", str(e))
 
-async def test_status_methods(controller, results):
+def test_status_methods(controller, results):
     """Test status and state methods"""
     print("\n📋 Testing Status Methods")
     print("-" * 40)
@@ -391,7 +391,7 @@ async def test_status_methods(controller, results):
     except Exception as e:
         results.fail_test("Status methods", str(e))
 
-async def test_edge_cases(controller, results):
+def test_edge_cases(controller, results):
     """Test edge cases and error conditions"""
     print("\n⚠️  Testing Edge Cases")
     print("-" * 40)
@@ -446,19 +446,19 @@ async def run_comprehensive_tests():
     
     try:
         # Test connection first - if this fails, we can't do other tests
-        if not await test_connection(controller, results):
+        if not test_connection(controller, results):
             print("❌ Connection failed - stopping tests")
             return
         
         # Run all test suites
-        await test_wavelength_operations(controller, results)
-        await test_power_operations(controller, results)
-        await test_output_control(controller, results)
-        await test_sweep_operations(controller, results)
-        await test_detector_operations(controller, results)
+        test_wavelength_operations(controller, results)
+        test_power_operations(controller, results)
+        test_output_control(controller, results)
+        test_sweep_operations(controller, results)
+        test_detector_operations(controller, results)
         await test_logging_operations(controller, results)
-        await test_status_methods(controller, results)
-        await test_edge_cases(controller, results)
+        test_status_methods(controller, results)
+        test_edge_cases(controller, results)
         
     except Exception as e:
         print(f"❌ Test suite failed with exception: {e}")
@@ -1,12 +1,11 @@
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass, asdict
 
 """
 Fine Align Configuration
 Cameron Basara, 2025
 """
 
-@dataclass
+@dataclass(slots=True)
 class FineAlignConfiguration:
     step_size: float = 0.1          # microns
     scan_window: float = 10.0       # microns
@@ -19,16 +18,7 @@ class FineAlignConfiguration:
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        return {
-            'step_size': self.step_size,
-            'scan_window': self.scan_window,
-            'threshold': self.threshold,
-            'gradient_iters': self.gradient_iters,
-            'min_gradient_ss': self.min_gradient_ss,
-            'primary_detector': self.primary_detector,
-            'ref_wl': self.ref_wl,
-            'timeout_s': self.timeout_s,
-        }
+        return asdict(self)
     
     @classmethod
     def default(cls) -> 'FineAlignConfiguration':
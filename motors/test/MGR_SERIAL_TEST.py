@@ -55,36 +55,20 @@ async def demo():
 
 
         async def home_all():
-            home_x = await mgr.home_limits(x)
-            if home_x:
-                print(f"x lims: {mgr.config.position_limits[x]}")
-            else:
-                print("x failed to home")
-                
-            home_y = await mgr.home_limits(y)
-            if home_y:
-                print(f"y lims: {mgr.config.position_limits[y]}")
-            else:
-                print("y failed to home")
-
-            home_z = await mgr.home_limits(z)
-            if home_z:
-                print(f"z lims: {mgr.config.position_limits[z]}")
-            else:
-                print("z failed to home")
-
-            
-            home_fr = await mgr.home_limits(fr)
-            if home_fr:
-                print(f"fr lims: {mgr.config.position_limits[fr]}")
-            else:
-                print("fr failed to home")
-
-            home_cp = await mgr.home_limits(cp)
-            if home_cp:
-                print(f"fr lims: {mgr.config.position_limits[cp]}")
-            else:
-                print("fr failed to home")
+            # Axes are independent hardware, so home them concurrently:
+            # wall time drops from the sum of per-axis times to the max
+            results = await asyncio.gather(
+                *(mgr.home_limits(axis) for axis in all),
+                return_exceptions=True
+            )
+            for axis, homed in zip(all, results):
+                name = axis.name.lower()
+                if isinstance(homed, Exception):
+                    print(f"{name} failed to home: {homed}")
+                elif homed:
+                    print(f"{name} lims: {mgr.config.position_limits[axis]}")
+                else:
+                    print(f"{name} failed to home")
 
         await home_all()
         # await mgr.home_limits(x)